@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import sys
 
 from contextlib import suppress
 from importlib import import_module
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -12,9 +15,9 @@ from cleo.application import Application as BaseApplication
 from cleo.events.console_command_event import ConsoleCommandEvent
 from cleo.events.console_events import COMMAND
 from cleo.events.event_dispatcher import EventDispatcher
+from cleo.exceptions import CleoCommandNotFoundError
 from cleo.exceptions import CleoError
 from cleo.formatters.style import Style
-from cleo.io.null_io import NullIO
 
 from poetry.__version__ import __version__
 from poetry.console.command_loader import CommandLoader
@@ -24,7 +27,9 @@ from poetry.console.commands.command import Command
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from cleo.commands.command import Command as BaseCommand
     from cleo.events.event import Event
+    from cleo.events.event_dispatcher import Listener
     from cleo.io.inputs.argv_input import ArgvInput
     from cleo.io.inputs.definition import Definition
     from cleo.io.inputs.input import Input
@@ -38,18 +43,27 @@ if TYPE_CHECKING:
     from poetry.poetry import Poetry
 
 
+@functools.lru_cache(maxsize=None)
+def _command_class(name: str) -> type[Command]:
+    module = import_module("poetry.console.commands." + name.replace(" ", "."))
+    command_class: type[Command] = getattr(
+        module, name.title().replace(" ", "") + "Command"
+    )
+    return command_class
+
+
+def _resolve(name: str) -> Command:
+    return _command_class(name)()
+
+
 def load_command(name: str) -> Callable[[], Command]:
     def _load() -> Command:
-        words = name.split(" ")
-        module = import_module("poetry.console.commands." + ".".join(words))
-        command_class = getattr(module, "".join(c.title() for c in words) + "Command")
-        command: Command = command_class()
-        return command
+        return _resolve(name)
 
     return _load
 
 
-COMMANDS = [
+COMMANDS = (
     "about",
     "add",
     "build",
@@ -90,7 +104,55 @@ COMMANDS = [
     "source add",
     "source remove",
     "source show",
-]
+)
+
+# Loggers configured for every command, in addition to the command's own loggers
+COMMAND_LOGGERS = (
+    "poetry.packages.locker",
+    "poetry.packages.package",
+    "poetry.utils.password_manager",
+)
+
+SHORTCUT_SPLIT_REGEX = re.compile(r"\|-?")
+
+STYLES = (
+    ("c1", Style("cyan")),
+    ("c2", Style("default", options=["bold"])),
+    ("info", Style("blue")),
+    ("comment", Style("green")),
+    ("warning", Style("yellow")),
+    ("debug", Style("default", options=["dark"])),
+    ("success", Style("green")),
+    # Dark variants
+    ("c1_dark", Style("cyan", options=["dark"])),
+    ("c2_dark", Style("default", options=["bold", "dark"])),
+    ("success_dark", Style("green", options=["dark"])),
+)
+
+
+class LazyCommandLoader(CommandLoader):
+    """
+    Command loader resolving Poetry's own commands on first access
+    instead of creating a factory for each of them upfront.
+
+    Poetry's commands are registered without a factory, so that plugins can
+    still check for, remove and replace them through ``_factories``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            cast("dict[str, Callable[[], BaseCommand]]", dict.fromkeys(COMMANDS))
+        )
+
+    def get(self, name: str) -> BaseCommand:
+        if name not in self._factories:
+            raise CleoCommandNotFoundError(name)
+
+        factory: Callable[[], BaseCommand] | None = self._factories[name]
+        if factory is None:
+            return _resolve(name)
+
+        return factory()
 
 
 class Application(BaseApplication):
@@ -103,24 +165,23 @@ class Application(BaseApplication):
         self._disable_cache = False
         self._plugins_loaded = False
 
+        # Listeners applicable to a command class, resolved on first use
+        self._command_listeners: dict[type[BaseCommand], tuple[Listener, ...]] = {}
+
         dispatcher = EventDispatcher()
-        dispatcher.add_listener(COMMAND, self.register_command_loggers)
-        dispatcher.add_listener(COMMAND, self.configure_env)
-        dispatcher.add_listener(COMMAND, self.configure_installer_for_event)
+        dispatcher.add_listener(COMMAND, self._dispatch_command_event)
         self.set_event_dispatcher(dispatcher)
 
-        command_loader = CommandLoader({name: load_command(name) for name in COMMANDS})
+        command_loader = LazyCommandLoader()
         self.set_command_loader(command_loader)
 
     @property
     def poetry(self) -> Poetry:
-        from pathlib import Path
-
-        from poetry.factory import Factory
-
         if self._poetry is not None:
             return self._poetry
 
+        from poetry.factory import Factory
+
         project_path = Path.cwd()
 
         if self._io and self._io.input.option("directory"):
@@ -154,18 +215,8 @@ class Application(BaseApplication):
 
         # Set our own CLI styles
         formatter = io.output.formatter
-        formatter.set_style("c1", Style("cyan"))
-        formatter.set_style("c2", Style("default", options=["bold"]))
-        formatter.set_style("info", Style("blue"))
-        formatter.set_style("comment", Style("green"))
-        formatter.set_style("warning", Style("yellow"))
-        formatter.set_style("debug", Style("default", options=["dark"]))
-        formatter.set_style("success", Style("green"))
-
-        # Dark variants
-        formatter.set_style("c1_dark", Style("cyan", options=["dark"]))
-        formatter.set_style("c2_dark", Style("default", options=["bold", "dark"]))
-        formatter.set_style("success_dark", Style("green", options=["dark"]))
+        for name, style in STYLES:
+            formatter.set_style(name, style)
 
         io.output.set_formatter(formatter)
         io.error_output.set_formatter(formatter)
@@ -182,10 +233,10 @@ class Application(BaseApplication):
         super().render_error(error, io)
 
     def _run(self, io: IO) -> int:
-        self._disable_plugins = io.input.parameter_option("--no-plugins")
+        self._disable_plugins = io.input.has_parameter_option("--no-plugins")
         self._disable_cache = io.input.has_parameter_option("--no-cache")
 
-        self._load_plugins(io)
+        self._load_plugins()
 
         exit_code: int = super()._run(io)
 
@@ -222,7 +273,9 @@ class Application(BaseApplication):
                     option = definition.option(option_name)
                     run_input.add_parameter_option("--" + option.name)
                     if option.shortcut:
-                        shortcuts = re.split(r"\|-?", option.shortcut.lstrip("-"))
+                        shortcuts = SHORTCUT_SPLIT_REGEX.split(
+                            option.shortcut.lstrip("-")
+                        )
                         shortcuts = [s for s in shortcuts if s]
                         for shortcut in shortcuts:
                             run_input.add_parameter_option("-" + shortcut.lstrip("-"))
@@ -238,27 +291,57 @@ class Application(BaseApplication):
 
         super()._configure_io(io)
 
+    def _dispatch_command_event(
+        self, event: Event, event_name: str, dispatcher: EventDispatcher
+    ) -> None:
+        assert isinstance(event, ConsoleCommandEvent)
+        command_type = type(event.command)
+        listeners = self._command_listeners.get(command_type)
+        if listeners is None:
+            listeners = self._get_command_listeners(command_type)
+            self._command_listeners[command_type] = listeners
+
+        for listener in listeners:
+            if event.is_propagation_stopped():
+                break
+
+            listener(event, event_name, dispatcher)
+
+    def _get_command_listeners(
+        self, command_type: type[BaseCommand]
+    ) -> tuple[Listener, ...]:
+        from poetry.console.commands.env_command import EnvCommand
+        from poetry.console.commands.installer_command import InstallerCommand
+        from poetry.console.commands.self.self_command import SelfCommand
+
+        if not issubclass(command_type, Command):
+            return ()
+
+        listeners: list[Listener] = [self.register_command_loggers]
+        if issubclass(command_type, EnvCommand) and not issubclass(
+            command_type, SelfCommand
+        ):
+            listeners.append(self.configure_env)
+        if issubclass(command_type, InstallerCommand):
+            listeners.append(self.configure_installer_for_event)
+
+        return tuple(listeners)
+
     def register_command_loggers(
         self, event: Event, event_name: str, _: EventDispatcher
     ) -> None:
-        from poetry.console.logging.filters import POETRY_FILTER
-        from poetry.console.logging.io_formatter import IOFormatter
-        from poetry.console.logging.io_handler import IOHandler
-
         assert isinstance(event, ConsoleCommandEvent)
         command = event.command
         if not isinstance(command, Command):
             return
 
-        io = event.io
+        from poetry.console.logging.filters import POETRY_FILTER
+        from poetry.console.logging.io_formatter import IOFormatter
+        from poetry.console.logging.io_handler import IOHandler
 
-        loggers = [
-            "poetry.packages.locker",
-            "poetry.packages.package",
-            "poetry.utils.password_manager",
-        ]
+        io = event.io
 
-        loggers += command.loggers
+        loggers = [*COMMAND_LOGGERS, *command.loggers]
 
         handler = IOHandler(io)
         handler.setFormatter(IOFormatter())
@@ -353,10 +436,8 @@ class Application(BaseApplication):
         if self._plugins_loaded:
             return
 
-        if io is None:
-            io = NullIO()
-
-        self._disable_plugins = io.input.has_parameter_option("--no-plugins")
+        if io is not None:
+            self._disable_plugins = io.input.has_parameter_option("--no-plugins")
 
         if not self._disable_plugins:
             from poetry.plugins.application_plugin import ApplicationPlugin
@@ -420,6 +501,18 @@ class Application(BaseApplication):
 
 
 def main() -> int:
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        # Answer a bare version request without setting up the application,
+        # its event listeners and plugins. The output mirrors what cleo prints
+        # for --version, including its styling when writing to a terminal.
+        from cleo.io.outputs.stream_output import StreamOutput
+
+        output = StreamOutput(sys.stdout)
+        for name, style in STYLES:
+            output.formatter.set_style(name, style)
+        output.write_line(f"<b>Poetry</b> (version <c1>{__version__}</c1>)")
+        return 0
+
     exit_code: int = Application().run()
     return exit_code
 
@@ -842,7 +842,7 @@ class Executor:
                 self._sections[id(operation)].clear()
                 progress.start()
 
-        for fetched_size in downloader.download_with_progress(chunk_size=4096):
+        for fetched_size in downloader.download_with_progress():
             if progress:
                 with self._lock:
                     progress.set_progress(fetched_size)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import List
+from typing import cast
 
 from poetry.packages.dependency_package import DependencyPackage
 
@@ -21,6 +22,15 @@ class PackageCollection(List[DependencyPackage]):
     ) -> None:
         self._dependency = dependency
 
+        packages = list(packages)
+        if all(
+            isinstance(package, DependencyPackage) and package.dependency is dependency
+            for package in packages
+        ):
+            # Nothing to wrap, let the list take the packages over as they are.
+            super().__init__(cast("list[DependencyPackage]", packages))
+            return
+
         super().__init__()
 
         for package in packages:
@@ -28,6 +38,10 @@ class PackageCollection(List[DependencyPackage]):
 
     def append(self, package: Package | DependencyPackage) -> None:
         if isinstance(package, DependencyPackage):
+            # Already bound to our dependency, no need to wrap it again.
+            if package.dependency is self._dependency:
+                return super().append(package)
+
             package = package.package
 
         package = DependencyPackage(self._dependency, package)
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import sys
 
-from contextlib import suppress
-
 
 # TODO: use try/except ImportError when
 # https://github.com/python/mypy/issues/1393 is fixed
@@ -31,8 +29,10 @@ def decode(string: bytes | str, encodings: list[str] | None = None) -> str:
     encodings = encodings or ["utf-8", "latin1", "ascii"]
 
     for encoding in encodings:
-        with suppress(UnicodeEncodeError, UnicodeDecodeError):
+        try:
             return string.decode(encoding)
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
 
     return string.decode(encodings[0], errors="ignore")
 
@@ -44,8 +44,10 @@ def encode(string: str, encodings: list[str] | None = None) -> bytes:
     encodings = encodings or ["utf-8", "latin1", "ascii"]
 
     for encoding in encodings:
-        with suppress(UnicodeEncodeError, UnicodeDecodeError):
+        try:
             return string.encode(encoding)
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
 
     return string.encode(encodings[0], errors="ignore")
 
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import hashlib
 import json
 import logging
+import os
 import shutil
 import threading
 import time
+import uuid
 
 from collections import defaultdict
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,8 +20,7 @@ from typing import Generic
 from typing import TypeVar
 from typing import overload
 
-from poetry.utils._compat import decode
-from poetry.utils._compat import encode
+from poetry.utils._compat import WINDOWS
 from poetry.utils.helpers import get_highest_priority_hash_type
 from poetry.utils.wheel import InvalidWheelName
 from poetry.utils.wheel import Wheel
@@ -30,6 +33,14 @@ if TYPE_CHECKING:
 
     from poetry.utils.env import Env
 
+try:
+    # Optional, speeds up (de)serialization of cache items considerably.
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
@@ -47,6 +58,21 @@ def _expiration(minutes: int) -> int:
     return round(time.time()) + minutes * 60
 
 
+def _json_dumps(data: Any) -> bytes:
+    if HAS_ORJSON:
+        dumped: bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return dumped
+
+    return json.dumps(data).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 _HASHES = {
     "md5": (hashlib.md5, 2),
     "sha1": (hashlib.sha1, 4),
@@ -82,6 +108,10 @@ class FileCache(Generic[T]):
 
     path: Path
     hash_type: str = "sha256"
+    _hasher: Callable[[bytes], Any] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _parts_count: int = dataclasses.field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.hash_type not in _HASHES:
@@ -89,6 +119,10 @@ class FileCache(Generic[T]):
                 f"FileCache.hash_type is unknown value: '{self.hash_type}'."
             )
 
+        hasher, parts_count = _HASHES[self.hash_type]
+        object.__setattr__(self, "_hasher", hasher)
+        object.__setattr__(self, "_parts_count", parts_count)
+
     def get(self, key: str) -> T | None:
         return self._get_payload(key)
 
@@ -113,8 +147,25 @@ class FileCache(Generic[T]):
         )
         path = self._path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as f:
-            f.write(self._serialize(payload))
+        # Write to a temporary file first and move it into place afterwards,
+        # so that readers never see a partially written cache file. The file is
+        # created with open() rather than tempfile, so that the umask applies
+        # just like it does for the final cache file.
+        data = self._serialize(payload)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("xb") as f:
+                f.write(data)
+            try:
+                os.replace(tmp_path, path)
+            except PermissionError:
+                # On Windows, the target cannot be replaced while another
+                # thread or process has it open, so write it in place instead.
+                if not WINDOWS:
+                    raise
+                path.write_bytes(data)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def forget(self, key: str) -> None:
         """
@@ -171,23 +222,32 @@ class FileCache(Generic[T]):
             return payload.data
 
     def _path(self, key: str) -> Path:
-        hash_type, parts_count = _HASHES[self.hash_type]
-        h = hash_type(encode(key)).hexdigest()
-        parts = [h[i : i + 2] for i in range(0, len(h), 2)][:parts_count]
+        h = self._hasher(key.encode()).hexdigest()
+        parts = [h[i : i + 2] for i in range(0, self._parts_count * 2, 2)]
         return Path(self.path, *parts, h)
 
     def _serialize(self, payload: CacheItem[T]) -> bytes:
         expires = payload.expires or MAX_DATE
-        data = json.dumps(payload.data)
-        return encode(f"{expires:010d}{data}")
+        return f"{expires:010d}".encode() + _json_dumps(payload.data)
 
     def _deserialize(self, data_raw: bytes) -> CacheItem[T]:
-        data_str = decode(data_raw)
-        data = json.loads(data_str[10:])
-        expires = int(data_str[:10])
+        data = _json_loads(data_raw[10:])
+        expires = int(data_raw[:10])
         return CacheItem(data, expires)
 
 
+@functools.lru_cache(maxsize=4096)
+def _hash_key_parts(key_parts: tuple[tuple[str, str], ...]) -> str:
+    # Builds the same string as json.dumps(dict(key_parts), sort_keys=True,
+    # separators=(",", ":"), ensure_ascii=True) without going through the
+    # generic encoder, so that existing cache directories remain valid.
+    serialized = ",".join(
+        f"{encode_basestring_ascii(name)}:{encode_basestring_ascii(value)}"
+        for name, value in sorted(key_parts)
+    )
+    return hashlib.sha256(f"{{{serialized}}}".encode("ascii")).hexdigest()
+
+
 class ArtifactCache:
     def __init__(self, *, cache_dir: Path) -> None:
         self._cache_dir = cache_dir
@@ -208,12 +268,8 @@ class ArtifactCache:
 
         return self._get_directory_from_hash(key_parts)
 
-    def _get_directory_from_hash(self, key_parts: object) -> Path:
-        key = hashlib.sha256(
-            json.dumps(
-                key_parts, sort_keys=True, separators=(",", ":"), ensure_ascii=True
-            ).encode("ascii")
-        ).hexdigest()
+    def _get_directory_from_hash(self, key_parts: dict[str, str]) -> Path:
+        key = _hash_key_parts(tuple(key_parts.items()))
 
         split_key = [key[:2], key[2:4], key[4:6], key[6:]]
         return self._cache_dir.joinpath(*split_key)
@@ -334,9 +390,13 @@ class ArtifactCache:
         return min(candidates)[1]
 
     def _get_cached_archives(self, cache_dir: Path) -> list[Path]:
-        archive_types = ["whl", "tar.gz", "tar.bz2", "bz2", "zip"]
-        paths: list[Path] = []
-        for archive_type in archive_types:
-            paths += cache_dir.glob(f"*.{archive_type}")
-
-        return paths
+        archive_suffixes = (".whl", ".tar.gz", ".tar.bz2", ".bz2", ".zip")
+        try:
+            with os.scandir(cache_dir) as entries:
+                return [
+                    cache_dir / entry.name
+                    for entry in entries
+                    if entry.name.endswith(archive_suffixes)
+                ]
+        except FileNotFoundError:
+            return []
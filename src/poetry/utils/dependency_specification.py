@@ -31,6 +31,8 @@ BaseSpec = TypeVar("BaseSpec", DependencySpec, InlineTable)
 
 GIT_URL_SCHEMES = {"git+http", "git+https", "git+ssh"}
 
+EXTRAS_REGEX = re.compile(r"\[([\w\d,-_]+)\]$")
+
 
 def dependency_to_specification(
     dependency: Dependency, specification: BaseSpec
@@ -197,7 +199,7 @@ class RequirementsParser:
 
         if " " in pair:
             name, version = pair.split(" ", 1)
-            extras_m = re.search(r"\[([\w\d,-_]+)\]$", name)
+            extras_m = EXTRAS_REGEX.search(name)
             if extras_m:
                 extras = [e.strip() for e in extras_m.group(1).split(",")]
                 name, _ = name.split("[")
@@ -211,7 +213,7 @@ class RequirementsParser:
             )
             if m:
                 name, constraint = m.group(1), m.group(2)
-                extras_m = re.search(r"\[([\w\d,-_]+)\]$", name)
+                extras_m = EXTRAS_REGEX.search(name)
                 if extras_m:
                     extras = [e.strip() for e in extras_m.group(1).split(",")]
                     name, _ = name.split("[")
@@ -219,7 +221,7 @@ class RequirementsParser:
                 require["name"] = name
                 require["version"] = constraint
             else:
-                extras_m = re.search(r"\[([\w\d,-_]+)\]$", pair)
+                extras_m = EXTRAS_REGEX.search(pair)
                 if extras_m:
                     extras = [e.strip() for e in extras_m.group(1).split(",")]
                     pair, _ = pair.split("[")
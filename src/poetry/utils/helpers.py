@@ -15,6 +15,7 @@ from collections.abc import Mapping
 from contextlib import contextmanager
 from contextlib import suppress
 from functools import cached_property
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -34,6 +35,7 @@ if TYPE_CHECKING:
 
     from poetry.core.packages.package import Package
     from requests import Session
+    from urllib3 import HTTPResponse
 
     from poetry.utils.authenticator import Authenticator
 
@@ -63,7 +65,7 @@ non_prioritised_available_hash_types: frozenset[str] = frozenset(
 
 @contextmanager
 def directory(path: Path) -> Iterator[Path]:
-    cwd = Path.cwd()
+    cwd = os.getcwd()
     try:
         os.chdir(path)
         yield path
@@ -88,13 +90,20 @@ def _on_rm_error(
 
 
 def _on_rm_error(func: Callable[[str], None], path: str, exc_info: Any) -> None:
-    if not os.path.exists(path):
+    exc = exc_info[1] if isinstance(exc_info, tuple) else exc_info
+    # Only a path that vanished in the meantime is fine to skip, there is no need
+    # to stat it. Otherwise, it is most likely read-only.
+    if isinstance(exc, FileNotFoundError):
         return
 
     os.chmod(path, stat.S_IWRITE)
     func(path)
 
 
+# `onerror` is deprecated in favor of `onexc` since Python 3.12.
+_RMTREE_ERROR_HANDLER_ARG = "onexc" if sys.version_info >= (3, 12) else "onerror"
+
+
 def remove_directory(path: Path, force: bool = False) -> None:
     """
     Helper function handle safe removal, and optionally forces stubborn file removal.
@@ -108,18 +117,21 @@ def remove_directory(path: Path, force: bool = False) -> None:
 
     kwargs: dict[str, Any] = {}
     if force:
-        onexc = "onexc" if sys.version_info >= (3, 12) else "onerror"
-        kwargs[onexc] = _on_rm_error
+        kwargs[_RMTREE_ERROR_HANDLER_ARG] = _on_rm_error
 
     shutil.rmtree(path, **kwargs)
 
 
 def merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> None:
-    for k in d2:
-        if k in d1 and isinstance(d1[k], dict) and isinstance(d2[k], Mapping):
-            merge_dicts(d1[k], d2[k])
-        else:
-            d1[k] = d2[k]
+    stack: list[tuple[dict[str, Any], Mapping[str, Any]]] = [(d1, d2)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            current = target.get(k)
+            if isinstance(current, dict) and isinstance(v, Mapping):
+                stack.append((current, v))
+            else:
+                target[k] = v
 
 
 class HTTPRangeRequestSupported(Exception):
@@ -131,7 +143,7 @@ def download_file(
     dest: Path,
     *,
     session: Authenticator | Session | None = None,
-    chunk_size: int = 1024,
+    chunk_size: int = 128 * 1024,
     raise_accepts_ranges: bool = False,
 ) -> None:
     from poetry.puzzle.provider import Indicator
@@ -147,19 +159,22 @@ def download_file(
 
         total_size = downloader.total_size
         if total_size > 0:
-            fetched_size = 0
-            last_percent = 0
-
             # if less than 1MB, we simply show that we're downloading
             # but skip the updating
             set_indicator = total_size > 1024 * 1024
 
+        if not set_indicator:
+            downloader.download(chunk_size)
+            return
+
+        # Number of bytes at which the next full percent is reached,
+        # so that the percentage is only computed when it changes.
+        next_percent_size = -(-total_size // 100)
         for fetched_size in downloader.download_with_progress(chunk_size):
-            if set_indicator:
+            if fetched_size >= next_percent_size:
                 percent = (fetched_size * 100) // total_size
-                if percent > last_percent:
-                    last_percent = percent
-                    update_context(f"Downloading {url} {percent:3}%")
+                update_context(f"Downloading {url} {percent:3}%")
+                next_percent_size = -(-(percent + 1) * total_size // 100)
 
 
 class Downloader:
@@ -191,14 +206,34 @@ class Downloader:
                 total_size = int(self._response.headers["Content-Length"])
         return total_size
 
-    def download_with_progress(self, chunk_size: int = 1024) -> Iterator[int]:
+    @cached_property
+    def _raw(self) -> HTTPResponse:
+        # Read from the underlying stream directly instead of going through
+        # iter_content(), but still undo any content encoding.
+        raw: HTTPResponse = self._response.raw
+        raw.decode_content = True
+        return raw
+
+    def download(self, chunk_size: int = 128 * 1024) -> None:
+        with atomic_open(self._dest) as f:
+            shutil.copyfileobj(self._raw, f, chunk_size)
+
+    def download_with_progress(self, chunk_size: int = 128 * 1024) -> Iterator[int]:
         fetched_size = 0
+        read = self._raw.read
         with atomic_open(self._dest) as f:
-            for chunk in self._response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    fetched_size += len(chunk)
-                    yield fetched_size
+            while chunk := read(chunk_size):
+                f.write(chunk)
+                fetched_size += len(chunk)
+                yield fetched_size
+
+
+@lru_cache(maxsize=2048)
+def _relative_posix_path(path: str, root: Path) -> str:
+    relative_path = os.path.relpath(path, os.fspath(root))
+    if os.sep != "/":
+        relative_path = relative_path.replace(os.sep, "/")
+    return relative_path
 
 
 def get_package_version_display_string(
@@ -206,7 +241,7 @@ def get_package_version_display_string(
 ) -> str:
     if package.source_type in ["file", "directory"] and root:
         assert package.source_url is not None
-        path = Path(os.path.relpath(package.source_url, root)).as_posix()
+        path = _relative_posix_path(package.source_url, root)
         return f"{package.version} {path}"
 
     pretty_version: str = package.full_pretty_version
@@ -214,17 +249,30 @@ def get_package_version_display_string(
 
 
 def paths_csv(paths: list[Path]) -> str:
-    return ", ".join(f'"{c!s}"' for c in paths)
+    if not paths:
+        return ""
+
+    return '"' + '", "'.join(str(c) for c in paths) + '"'
 
 
 def is_dir_writable(path: Path, create: bool = False) -> bool:
+    # Probe right away instead of checking whether the directory exists first,
+    # a missing directory makes the probe fail anyway.
+    try:
+        with tempfile.TemporaryFile(dir=os.fspath(path)):
+            pass
+    except FileNotFoundError:
+        if not create:
+            return False
+    except OSError:
+        return False
+    else:
+        return True
+
     try:
-        if not path.exists():
-            if not create:
-                return False
-            path.mkdir(parents=True, exist_ok=True)
+        path.mkdir(parents=True, exist_ok=True)
 
-        with tempfile.TemporaryFile(dir=str(path)):
+        with tempfile.TemporaryFile(dir=os.fspath(path)):
             pass
     except OSError:
         return False
@@ -233,9 +281,7 @@ def is_dir_writable(path: Path, create: bool = False) -> bool:
 
 
 def pluralize(count: int, word: str = "") -> str:
-    if count == 1:
-        return word
-    return word + "s"
+    return word if count == 1 else word + "s"
 
 
 def _get_win_folder_from_registry(csidl_name: str) -> str:
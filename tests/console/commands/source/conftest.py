@@ -4,24 +4,50 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from tomlkit.items import AoT
+
 from poetry.config.source import Source
 from poetry.repositories.repository_pool import Priority
+from poetry.utils.source import source_to_table
 
 
 if TYPE_CHECKING:
     from poetry.poetry import Poetry
-    from tests.types import CommandTesterFactory
     from tests.types import ProjectFactory
 
 
+_source_one = Source(name="one", url="https://one.com")
+_source_two = Source(name="two", url="https://two.com")
+_source_primary = Source(
+    name="primary", url="https://primary.com", priority=Priority.PRIMARY
+)
+_source_default = Source(
+    name="default", url="https://default.com", priority=Priority.DEFAULT
+)
+_source_secondary = Source(
+    name="secondary", url="https://secondary.com", priority=Priority.SECONDARY
+)
+_source_supplemental = Source(
+    name="supplemental",
+    url="https://supplemental.com",
+    priority=Priority.SUPPLEMENTAL,
+)
+_source_explicit = Source(
+    name="explicit", url="https://explicit.com", priority=Priority.EXPLICIT
+)
+_source_pypi = Source(name="PyPI")
+_source_pypi_explicit = Source(name="PyPI", priority=Priority.EXPLICIT)
+_existing_source = Source(name="existing", url="https://existing.com")
+
+
 @pytest.fixture
 def source_one() -> Source:
-    return Source(name="one", url="https://one.com")
+    return _source_one
 
 
 @pytest.fixture
 def source_two() -> Source:
-    return Source(name="two", url="https://two.com")
+    return _source_two
 
 
 @pytest.fixture
@@ -36,48 +62,37 @@ def source_secondary_deprecated() -> Source:
 
 @pytest.fixture
 def source_primary() -> Source:
-    return Source(name="primary", url="https://primary.com", priority=Priority.PRIMARY)
+    return _source_primary
 
 
 @pytest.fixture
 def source_default() -> Source:
-    return Source(name="default", url="https://default.com", priority=Priority.DEFAULT)
+    return _source_default
 
 
 @pytest.fixture
 def source_secondary() -> Source:
-    return Source(
-        name="secondary", url="https://secondary.com", priority=Priority.SECONDARY
-    )
+    return _source_secondary
 
 
 @pytest.fixture
 def source_supplemental() -> Source:
-    return Source(
-        name="supplemental",
-        url="https://supplemental.com",
-        priority=Priority.SUPPLEMENTAL,
-    )
+    return _source_supplemental
 
 
 @pytest.fixture
 def source_explicit() -> Source:
-    return Source(
-        name="explicit", url="https://explicit.com", priority=Priority.EXPLICIT
-    )
+    return _source_explicit
 
 
 @pytest.fixture
 def source_pypi() -> Source:
-    return Source(name="PyPI")
+    return _source_pypi
 
 
 @pytest.fixture
 def source_pypi_explicit() -> Source:
-    return Source(name="PyPI", priority=Priority.EXPLICIT)
-
-
-_existing_source = Source(name="existing", url="https://existing.com")
+    return _source_pypi_explicit
 
 
 @pytest.fixture
@@ -141,21 +156,26 @@ def poetry_with_pypi_and_other(project_factory: ProjectFactory) -> Poetry:
     return project_factory(pyproject_content=PYPROJECT_WITH_PYPI_AND_OTHER)
 
 
+def _add_sources(poetry: Poetry, *sources: Source) -> None:
+    # Write the end state that repeated "source add" calls would produce without
+    # going through the command for every source.
+    poetry.pyproject.poetry_config["source"] = AoT(
+        [source_to_table(source) for source in [*poetry.get_sources(), *sources]]
+    )
+    poetry.pyproject.save()
+
+
 @pytest.fixture
 def add_multiple_sources(
-    command_tester_factory: CommandTesterFactory,
     poetry_with_source: Poetry,
     source_one: Source,
     source_two: Source,
 ) -> None:
-    add = command_tester_factory("source add", poetry=poetry_with_source)
-    for source in [source_one, source_two]:
-        add.execute(f"{source.name} {source.url}")
+    _add_sources(poetry_with_source, source_one, source_two)
 
 
 @pytest.fixture
 def add_all_source_types(
-    command_tester_factory: CommandTesterFactory,
     poetry_with_source: Poetry,
     source_primary: Source,
     source_default: Source,
@@ -163,12 +183,11 @@ def add_all_source_types(
     source_supplemental: Source,
     source_explicit: Source,
 ) -> None:
-    add = command_tester_factory("source add", poetry=poetry_with_source)
-    for source in [
+    _add_sources(
+        poetry_with_source,
         source_primary,
         source_default,
         source_secondary,
         source_supplemental,
         source_explicit,
-    ]:
-        add.execute(f"{source.name} {source.url} --priority={source.name}")
+    )
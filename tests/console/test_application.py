@@ -9,7 +9,10 @@ import pytest
 
 from cleo.testers.application_tester import ApplicationTester
 
+from poetry.__version__ import __version__
+from poetry.console import application
 from poetry.console.application import Application
+from poetry.console.application import main
 from poetry.console.commands.command import Command
 from poetry.plugins.application_plugin import ApplicationPlugin
 from poetry.repositories.cached_repository import CachedRepository
@@ -18,6 +21,7 @@ from tests.helpers import mock_metadata_entry_points
 
 
 if TYPE_CHECKING:
+    from pytest import CaptureFixture
     from pytest_mock import MockerFixture
 
 
@@ -126,3 +130,100 @@ def test_application_verify_cache_flag_at_install(
         (name, args, kwargs) = call
         assert "disable_cache" in kwargs
         assert disable_cache is kwargs["disable_cache"]
+
+
+def test_application_resolves_commands_lazily(mocker: MockerFixture) -> None:
+    application._command_class.cache_clear()
+    import_module = mocker.spy(application, "import_module")
+    app = Application()
+
+    assert app.command_loader.has("self show plugins")
+    import_module.assert_not_called()
+
+    command = app.command_loader.get("self show plugins")
+
+    assert command.name == "self show plugins"
+    import_module.assert_called_once_with("poetry.console.commands.self.show.plugins")
+
+
+def test_application_allows_plugins_to_override_builtin_commands() -> None:
+    app = Application()
+    loader = app.command_loader
+
+    assert loader.has("about")
+    del loader._factories["about"]
+    assert not loader.has("about")
+
+    loader.register_factory("about", FooCommand)
+
+    assert loader.has("about")
+    assert isinstance(loader.get("about"), FooCommand)
+    assert loader.names.count("about") == 1
+
+
+@pytest.mark.parametrize("option", ["--version", "-V"])
+def test_main_version_does_not_create_application(
+    mocker: MockerFixture, capsys: CaptureFixture[str], option: str
+) -> None:
+    mocker.patch("sys.argv", ["poetry", option])
+    init = mocker.spy(Application, "__init__")
+
+    assert main() == 0
+    assert capsys.readouterr().out == f"Poetry (version {__version__})\n"
+    init.assert_not_called()
+
+
+def test_application_imports_command_module_once(mocker: MockerFixture) -> None:
+    application._command_class.cache_clear()
+    import_module = mocker.spy(application, "import_module")
+    app = Application()
+
+    first = app.command_loader.get("self show plugins")
+    second = app.command_loader.get("self show plugins")
+
+    assert first is not second
+    assert type(first) is type(second)
+    import_module.assert_called_once()
+
+
+@pytest.mark.parametrize("disable_plugins", [True, False])
+def test_application_verify_plugins_flag_with_plugins_loaded(
+    disable_plugins: bool,
+) -> None:
+    app = Application()
+    app._load_plugins()
+
+    tester = ApplicationTester(app)
+    command = "about"
+
+    if disable_plugins:
+        command = f"{command} --no-plugins"
+
+    tester.execute(command)
+
+    assert app._disable_plugins is disable_plugins
+
+
+@pytest.mark.parametrize(
+    ("command", "listeners"),
+    [
+        ("about", ["register_command_loggers"]),
+        ("self show", ["register_command_loggers", "configure_installer_for_event"]),
+        ("show", ["register_command_loggers", "configure_env"]),
+        (
+            "install",
+            [
+                "register_command_loggers",
+                "configure_env",
+                "configure_installer_for_event",
+            ],
+        ),
+    ],
+)
+def test_application_command_listeners(command: str, listeners: list[str]) -> None:
+    app = Application()
+    command_type = type(app.find(command))
+
+    assert [
+        listener.__name__ for listener in app._get_command_listeners(command_type)
+    ] == listeners
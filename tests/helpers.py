@@ -127,7 +127,7 @@ def mock_download(
     dest: Path,
     *,
     session: Authenticator | Session | None = None,
-    chunk_size: int = 1024,
+    chunk_size: int = 128 * 1024,
     raise_accepts_ranges: bool = False,
 ) -> None:
     parts = urllib.parse.urlparse(url)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.packages.dependency_package import DependencyPackage
+from poetry.packages.package_collection import PackageCollection
+
+
+def test_package_collection_wraps_packages() -> None:
+    dependency = Dependency("foo", "^1.0")
+    package = Package("foo", "1.0")
+
+    collection = PackageCollection(dependency, [package])
+
+    assert len(collection) == 1
+    assert isinstance(collection[0], DependencyPackage)
+    assert collection[0].dependency is dependency
+    assert collection[0].package is package
+
+
+def test_package_collection_keeps_packages_bound_to_dependency() -> None:
+    dependency = Dependency("foo", "^1.0")
+    dependency_package = DependencyPackage(dependency, Package("foo", "1.0"))
+
+    collection = PackageCollection(dependency, [dependency_package])
+
+    assert collection[0] is dependency_package
+
+
+def test_package_collection_rebinds_packages_of_other_dependency() -> None:
+    dependency = Dependency("foo", "^1.0")
+    other_dependency = Dependency("foo", ">=1.0")
+    package = Package("foo", "1.0")
+    dependency_package = DependencyPackage(other_dependency, package)
+
+    collection = PackageCollection(dependency, [dependency_package])
+
+    assert collection[0] is not dependency_package
+    assert collection[0].dependency is dependency
+    assert collection[0].package is package
+
+
+def test_package_collection_mixed_packages() -> None:
+    dependency = Dependency("foo", ">=1.0")
+    dependency_package = DependencyPackage(dependency, Package("foo", "1.0"))
+    package = Package("foo", "2.0")
+    packages: list[Package | DependencyPackage] = [dependency_package, package]
+
+    collection = PackageCollection(dependency, iter(packages))
+
+    assert len(collection) == 2
+    assert collection[0] is dependency_package
+    assert collection[1].dependency is dependency
+    assert collection[1].package is package
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import concurrent.futures
+import hashlib
+import json
+import os
 import shutil
+import stat
 import traceback
 
 from pathlib import Path
@@ -13,8 +17,10 @@ import pytest
 from packaging.tags import Tag
 from poetry.core.packages.utils.link import Link
 
+from poetry.utils._compat import WINDOWS
 from poetry.utils.cache import ArtifactCache
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import _hash_key_parts
 from poetry.utils.env import MockEnv
 
 
@@ -58,6 +64,78 @@ def test_cache_get_put_has(repository_cache_dir: Path) -> None:
     assert not cache.has("key3")
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_cache_get_put_non_ascii(
+    poetry_file_cache: FileCache[Any], mocker: MockerFixture, use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        mocker.patch("poetry.utils.cache.HAS_ORJSON", False)
+
+    poetry_file_cache.put("key1", {"name": "pöetry", "authors": ["Sébastien"]})
+
+    assert poetry_file_cache.get("key1") == {
+        "name": "pöetry",
+        "authors": ["Sébastien"],
+    }
+
+
+@pytest.mark.parametrize("write_with_orjson", [True, False])
+def test_cache_get_put_across_json_implementations(
+    poetry_file_cache: FileCache[Any], mocker: MockerFixture, write_with_orjson: bool
+) -> None:
+    pytest.importorskip("orjson")
+    value = {"name": "pöetry", "authors": ["Sébastien"], "size": 1.5, "yanked": None}
+
+    mocker.patch("poetry.utils.cache.HAS_ORJSON", write_with_orjson)
+    poetry_file_cache.put("key1", value)
+
+    mocker.patch("poetry.utils.cache.HAS_ORJSON", not write_with_orjson)
+    assert poetry_file_cache.get("key1") == value
+
+
+def test_cache_put_replaces_atomically(poetry_file_cache: FileCache[Any]) -> None:
+    poetry_file_cache.put("key1", "value")
+    poetry_file_cache.put("key1", "other value")
+
+    assert poetry_file_cache.get("key1") == "other value"
+    path = poetry_file_cache._path("key1")
+    assert list(path.parent.iterdir()) == [path]
+
+    if not WINDOWS:
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+
+def test_cache_put_falls_back_to_write_in_place_on_windows(
+    poetry_file_cache: FileCache[Any], mocker: MockerFixture
+) -> None:
+    poetry_file_cache.put("key1", "value")
+
+    mocker.patch("poetry.utils.cache.WINDOWS", True)
+    mocker.patch("os.replace", side_effect=PermissionError)
+    poetry_file_cache.put("key1", "other value")
+
+    assert poetry_file_cache.get("key1") == "other value"
+    path = poetry_file_cache._path("key1")
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_cache_put_does_not_ignore_permission_error_on_posix(
+    poetry_file_cache: FileCache[Any], mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.utils.cache.WINDOWS", False)
+    mocker.patch("os.replace", side_effect=PermissionError)
+
+    with pytest.raises(PermissionError):
+        poetry_file_cache.put("key1", "value")
+
+    path = poetry_file_cache._path("key1")
+    assert list(path.parent.iterdir()) == []
+
+
 def test_cache_forget(repository_cache_dir: Path) -> None:
     cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
     cache.put("key1", "value")
@@ -188,6 +266,25 @@ def test_get_cache_directory_for_link(tmp_path: Path) -> None:
     assert directory == expected
 
 
+@pytest.mark.parametrize(
+    "key_parts",
+    [
+        (("url", "https://example.com/demo-0.1.0.tar.gz"),),
+        (
+            ("url", "https://example.com/démo-0.1.0.tar.gz"),
+            ("sha256", "abc"),
+            ("subdirectory", 'sub "dir"\\ü'),
+        ),
+    ],
+)
+def test_hash_key_parts_matches_json(key_parts: tuple[tuple[str, str], ...]) -> None:
+    serialized = json.dumps(
+        dict(key_parts), sort_keys=True, separators=(",", ":"), ensure_ascii=True
+    )
+
+    assert _hash_key_parts(key_parts) == hashlib.sha256(serialized.encode()).hexdigest()
+
+
 @pytest.mark.parametrize("subdirectory", [None, "subdir"])
 def test_get_cache_directory_for_git(tmp_path: Path, subdirectory: str | None) -> None:
     cache = ArtifactCache(cache_dir=tmp_path)
@@ -221,6 +318,12 @@ def test_get_cached_archives(fixture_dir: FixtureDirGetter) -> None:
     )
 
 
+def test_get_cached_archives_missing_cache_dir(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+
+    assert cache._get_cached_archives(tmp_path / "missing") == []
+
+
 @pytest.mark.parametrize(
     ("link", "strict", "available_packages"),
     [
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import os
+import stat
+
+from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -7,17 +12,24 @@ import pytest
 
 from poetry.core.utils.helpers import parse_requires
 
+from poetry.utils.helpers import Downloader
 from poetry.utils.helpers import HTTPRangeRequestSupported
+from poetry.utils.helpers import _on_rm_error
 from poetry.utils.helpers import download_file
 from poetry.utils.helpers import get_file_hash
 from poetry.utils.helpers import get_highest_priority_hash_type
+from poetry.utils.helpers import is_dir_writable
+from poetry.utils.helpers import merge_dicts
+from poetry.utils.helpers import paths_csv
 
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
+    from collections.abc import Iterator
 
     from httpretty import httpretty
     from httpretty.core import HTTPrettyRequest
+    from pytest_mock import MockerFixture
 
     from tests.types import FixtureDirGetter
 
@@ -145,6 +157,47 @@ def test_download_file(
     assert http.last_request().headers["Accept-Encoding"] == "Identity"
 
 
+def test_download_file_progress(
+    http: type[httpretty], tmp_path: Path, mocker: MockerFixture
+) -> None:
+    content = b"x" * (2 * 1024 * 1024)
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=content)
+    contexts: list[str | None] = []
+
+    @contextmanager
+    def context() -> Iterator[Callable[[str | None], None]]:
+        yield contexts.append
+
+    mocker.patch("poetry.puzzle.provider.Indicator.context", context)
+
+    download_file(url, tmp_path / "demo-0.1.0.tar.gz", chunk_size=512 * 1024)
+
+    assert contexts == [
+        f"Downloading {url}",
+        f"Downloading {url}  25%",
+        f"Downloading {url}  50%",
+        f"Downloading {url}  75%",
+        f"Downloading {url} 100%",
+    ]
+
+
+def test_downloader_download_with_progress(
+    http: type[httpretty], tmp_path: Path
+) -> None:
+    content = bytes(range(256)) * 4 * 1024
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=content)
+    dest = tmp_path / "demo-0.1.0.tar.gz"
+
+    downloader = Downloader(url, dest)
+    progress = list(downloader.download_with_progress(chunk_size=256 * 1024))
+
+    assert downloader.total_size == len(content)
+    assert progress == [256 * 1024, 512 * 1024, 768 * 1024, len(content)]
+    assert dest.read_bytes() == content
+
+
 @pytest.mark.parametrize(
     "hash_types,expected",
     [
@@ -188,3 +241,74 @@ def test_download_file_raise_accepts_ranges(
     else:
         download_file(url, dest, raise_accepts_ranges=raise_accepts_ranges)
         assert dest.is_file()
+
+
+def test_merge_dicts() -> None:
+    d1: dict[str, Any] = {
+        "a": 1,
+        "b": {"c": 2, "d": {"e": 3}},
+        "f": {"g": 4},
+    }
+    d2: dict[str, Any] = {
+        "a": 5,
+        "b": {"d": {"h": 6}, "i": 7},
+        "f": 8,
+        "j": {"k": 9},
+    }
+
+    merge_dicts(d1, d2)
+
+    assert d1 == {
+        "a": 5,
+        "b": {"c": 2, "d": {"e": 3, "h": 6}, "i": 7},
+        "f": 8,
+        "j": {"k": 9},
+    }
+
+
+def test_is_dir_writable(tmp_path: Path) -> None:
+    assert is_dir_writable(tmp_path)
+    assert not is_dir_writable(tmp_path / "missing")
+    assert not (tmp_path / "missing").exists()
+    assert is_dir_writable(tmp_path / "missing" / "nested", create=True)
+    assert (tmp_path / "missing" / "nested").is_dir()
+
+    file = tmp_path / "file"
+    file.touch()
+    assert not is_dir_writable(file)
+    assert not is_dir_writable(file, create=True)
+
+
+@pytest.mark.parametrize(
+    ("paths", "expected"),
+    [
+        ([], ""),
+        ([Path("foo")], '"foo"'),
+        ([Path("foo"), Path("bar")], '"foo", "bar"'),
+    ],
+)
+def test_paths_csv(paths: list[Path], expected: str) -> None:
+    assert paths_csv(paths) == expected
+
+
+@pytest.mark.parametrize("as_tuple", [False, True])
+def test_on_rm_error(tmp_path: Path, mocker: MockerFixture, as_tuple: bool) -> None:
+    def exc_info(error: OSError) -> Any:
+        return (type(error), error, None) if as_tuple else error
+
+    read_only = tmp_path / "read-only"
+    read_only.touch()
+    read_only.chmod(stat.S_IREAD)
+    chmod = mocker.spy(os, "chmod")
+
+    _on_rm_error(os.unlink, str(read_only), exc_info(PermissionError()))
+
+    chmod.assert_called_once_with(str(read_only), stat.S_IWRITE)
+    assert not read_only.exists()
+
+    chmod.reset_mock()
+    func = mocker.Mock()
+    _on_rm_error(func, str(read_only), exc_info(FileNotFoundError()))
+
+    chmod.assert_not_called()
+    func.assert_not_called()